@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 PostToolUse Hook - Log Tool Outputs + Phoenix Restart Logic
-1. Logs ALL tool outputs to session_events.json
+1. Logs ALL tool outputs to session_events.jsonl
 2. Detects meta-agent completion for phoenix restart
 """
 
@@ -11,15 +11,21 @@ import subprocess
 import re
 from pathlib import Path
 
-# Import session logger
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Import session logger from the repo root (hooks run under -S -I, which
+# leaves only the stdlib on sys.path)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 try:
-    from session_logger import log_post_tool_use
+    from session_logger import log_post_tool_use, flush as flush_session_log
 except ImportError:
     # Fallback if import fails
     def log_post_tool_use(data):
         print(f"[POST-TOOL] {json.dumps(data)}", file=sys.stderr)
 
+    def flush_session_log():
+        pass
+
+from hook_utils import count_files
+
 
 def detect_agent_creation_completion(response_text):
     """Detect the exact meta-agent completion pattern
@@ -53,7 +59,7 @@ def register_mcp_servers():
         # Run the MCP registration script
         result = subprocess.run([
             sys.executable, str(script_path)
-        ], capture_output=True, text=True, cwd=".")
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=".")
         
         if result.returncode == 0:
             print("[PHOENIX] MCP servers registered successfully", file=sys.stderr)
@@ -70,6 +76,10 @@ def register_mcp_servers():
 def signal_phoenix_restart():
     """Signal the launcher that a restart is needed"""
     try:
+        # The launcher kills this hook's process group as soon as the marker
+        # appears, so buffered session events must be on disk before it exists
+        flush_session_log()
+        
         # Create the restart marker file
         marker_file = Path(".restart_needed")
         marker_file.touch()
@@ -147,14 +157,9 @@ def main():
                     
             else:
                 # Fallback: Check if files were created even without completion signal
-                agents_dir = Path(".claude/agents")
-                mcp_dir = Path("dynamic_agents/generated_mcp")
-                
                 files_created = (
-                    agents_dir.exists() and 
-                    len(list(agents_dir.glob("*.md"))) > 1 and  # More than just meta-agent.md
-                    mcp_dir.exists() and
-                    len(list(mcp_dir.glob("*.py"))) > 0
+                    count_files(".claude/agents", ".md", 2) > 1 and  # More than just meta-agent.md
+                    count_files("dynamic_agents/generated_mcp", ".py", 1) > 0
                 )
                 
                 if files_created:
@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """
 PreToolUse Hook - Log Tool Inputs
-Captures tool inputs before execution in session_events.json
+Captures tool inputs before execution in session_events.jsonl
 """
 
 import json
 import sys
 from pathlib import Path
 
-# Import session logger
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Import session logger from the repo root (hooks run under -S -I, which
+# leaves only the stdlib on sys.path)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 try:
     from session_logger import log_pre_tool_use
 except ImportError:
@@ -13,9 +13,9 @@ import re
 from pathlib import Path
 
 # Import flow logger for strategic logging
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 try:
-    from flow_logger import log_step_2, log_step_3, log_error
+    from flow_logger import log_step_2, log_step_3, log_error, flush as flush_flow_log
 except ImportError:
     # Fallback if flow_logger not available
     def log_step_2(event, data=None):
@@ -24,6 +24,10 @@ except ImportError:
         print(f"[STEP-3] {event}", file=sys.stderr)
     def log_error(step, error, data=None):
         print(f"[ERROR-{step}] {error}", file=sys.stderr)
+    def flush_flow_log():
+        pass
+
+from hook_utils import count_files
 
 
 def detect_agent_creation_completion(response_text):
@@ -58,7 +62,7 @@ def register_mcp_servers():
         # Run the MCP registration script
         result = subprocess.run([
             sys.executable, str(script_path)
-        ], capture_output=True, text=True, cwd=".")
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=".")
         
         if result.returncode == 0:
             log_step_3("MCP servers registered successfully", {
@@ -81,6 +85,10 @@ def register_mcp_servers():
 def signal_phoenix_restart():
     """Signal the launcher that a restart is needed"""
     try:
+        # The launcher kills this hook's process group as soon as the marker
+        # appears, so queued flow log entries must be on disk before it exists
+        flush_flow_log()
+        
         # Create the restart marker file
         marker_file = Path(".restart_needed")
         marker_file.touch()
@@ -89,6 +97,7 @@ def signal_phoenix_restart():
             "restart_status": "marker created",
             "marker_file": str(marker_file)
         })
+        flush_flow_log()
         
         return True
         
@@ -114,6 +123,7 @@ def main():
             input_data = json.loads(input_text)
         except json.JSONDecodeError as e:
             log_error(3, f"JSON parse error: {e}")
+            flush_flow_log()
             sys.exit(0)
         
         # Extract tool information
@@ -169,14 +179,9 @@ def main():
         else:
             # Check if files were created even without completion signal
             # This is a fallback for cases where meta-agent doesn't output the signal
-            agents_dir = Path(".claude/agents")
-            mcp_dir = Path("dynamic_agents/generated_mcp")
-            
             files_created = (
-                agents_dir.exists() and 
-                len(list(agents_dir.glob("*.md"))) > 1 and  # More than just meta-agent.md
-                mcp_dir.exists() and
-                len(list(mcp_dir.glob("*.py"))) > 0
+                count_files(".claude/agents", ".md", 2) > 1 and  # More than just meta-agent.md
+                count_files("dynamic_agents/generated_mcp", ".py", 1) > 0
             )
             
             if files_created:
@@ -199,10 +204,12 @@ def main():
                 # This is normal for some meta-agent calls
                 pass
         
+        flush_flow_log()
         sys.exit(0)
         
     except Exception as e:
         log_error(3, f"Phoenix hook error: {e}")
+        flush_flow_log()
         sys.exit(0)  # Always exit gracefully to avoid breaking Claude
 
 
@@ -9,8 +9,9 @@ import sys
 import subprocess
 from pathlib import Path
 
-# Import session logger
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Import session logger from the repo root (hooks run under -S -I, which
+# leaves only the stdlib on sys.path)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 try:
     from session_logger import log_step_3
 except ImportError:
@@ -30,7 +31,7 @@ def register_mcp_servers():
     try:
         result = subprocess.run([
             sys.executable, str(script_path)
-        ], capture_output=True, text=True, cwd=".")
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=".")
         
         if result.returncode == 0:
             print("[SUBAGENT-STOP] MCP servers registered successfully", file=sys.stderr)
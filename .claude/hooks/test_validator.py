@@ -3,8 +3,31 @@
 Test script for the bash command validator
 """
 
+import contextlib
+import io
 import json
-import subprocess
+import runpy
+import sys
+from pathlib import Path
+
+# Load the validator once and call its hook entry point in-process, instead of
+# starting a fresh interpreter for every test command
+VALIDATOR = runpy.run_path(str(Path(__file__).with_name("bash_validator.py")), run_name="bash_validator")
+
+def run_validator(test_data):
+    """Feed test_data to the validator hook; returns (exit code, stderr text)"""
+    stdin_saved = sys.stdin
+    sys.stdin = io.StringIO(json.dumps(test_data))
+    err = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(err):
+            VALIDATOR["main"]()
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        sys.stdin = stdin_saved
+    return code, err.getvalue()
 
 def test_command(command, description="Test command"):
     """Test a command with the validator"""
@@ -16,18 +39,13 @@ def test_command(command, description="Test command"):
     }
     
     try:
-        result = subprocess.run(
-            ["python3", "./.claude/hooks/bash_validator.py"],
-            input=json.dumps(test_data),
-            text=True,
-            capture_output=True
-        )
+        returncode, stderr = run_validator(test_data)
         
-        status = "ALLOWED" if result.returncode == 0 else "BLOCKED"
+        status = "ALLOWED" if returncode == 0 else "BLOCKED"
         print(f"Command: {command}")
         print(f"Status: {status}")
-        if result.stderr:
-            print(f"Message: {result.stderr.strip()}")
+        if stderr:
+            print(f"Message: {stderr.strip()}")
         print("-" * 50)
         
     except Exception as e:
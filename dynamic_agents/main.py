@@ -8,7 +8,9 @@ import os
 import sys
 import json
 import asyncio
+import functools
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -27,6 +29,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+async def _ainput(prompt: str) -> str:
+    """input() on a daemon thread so a pending read never blocks loop shutdown"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read():
+        # Read the unbuffered raw stream: a thread parked inside sys.stdin's
+        # BufferedReader holds its lock and aborts interpreter shutdown
+        try:
+            line = sys.stdin.buffer.raw.readline()
+            if not line:
+                raise EOFError("EOF when reading a line")
+            callback = (resolve, future.set_result,
+                        line.decode(sys.stdin.encoding, "replace").rstrip("\r\n"))
+        except BaseException as e:
+            callback = (resolve, future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    print(prompt, end="", flush=True)
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 class DynamicAgentOrchestrator:
     """Main orchestrator for dynamic agent system"""
     
@@ -43,14 +76,21 @@ class DynamicAgentOrchestrator:
         # Load main orchestrator prompt
         self.main_prompt = self._load_system_prompt("main_orchestrator.md")
         
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _cached_read(path_str: str, mtime_ns: int) -> str:
+        """Read a prompt file; keyed on mtime so edits invalidate the cache"""
+        return Path(path_str).read_text(encoding='utf-8')
+    
     def _load_system_prompt(self, filename: str) -> str:
         """Load a system prompt from file"""
         prompt_path = self.system_prompts_dir / filename
-        if prompt_path.exists():
-            return prompt_path.read_text(encoding='utf-8')
-        else:
+        try:
+            mtime_ns = prompt_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"System prompt file not found: {prompt_path}")
             return ""
+        return self._cached_read(str(prompt_path), mtime_ns)
     
     async def process_request(self, user_prompt: str, options: Optional[ClaudeCodeOptions] = None) -> List[Message]:
         """Process a user request through the dynamic agent system"""
@@ -106,7 +146,7 @@ class DynamicAgentOrchestrator:
         
         while True:
             try:
-                user_input = input("\nYour request: ").strip()
+                user_input = (await _ainput("\nYour request: ")).strip()
                 
                 if user_input.lower() in ['exit', 'quit', 'q']:
                     print("Goodbye!")
@@ -125,7 +165,8 @@ class DynamicAgentOrchestrator:
                             print(f"\nResult:\n{msg.result}")
                         break
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # asyncio.run() turns Ctrl-C into a cancellation of this task
                 print("\nInterrupted. Goodbye!")
                 break
             except Exception as e:
@@ -133,8 +174,8 @@ class DynamicAgentOrchestrator:
                 print(f"\nError: {e}")
 
 
-async def main():
-    """Main entry point"""
+def _build_parser():
+    """Build the full argparse parser (only needed for --help and bad input)"""
     import argparse
     
     parser = argparse.ArgumentParser(description="Dynamic Agent System")
@@ -142,8 +183,43 @@ async def main():
     parser.add_argument("--working-dir", type=Path, help="Working directory")
     parser.add_argument("--max-turns", type=int, default=10, help="Maximum conversation turns")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    return parser
+
+
+def parse_args(argv: List[str]):
+    """Parse the small fixed CLI by hand, deferring to argparse for anything unusual"""
+    from types import SimpleNamespace
     
-    args = parser.parse_args()
+    args = SimpleNamespace(prompt=None, working_dir=None, max_turns=10, verbose=False)
+    i = 0
+    try:
+        while i < len(argv):
+            arg = argv[i]
+            key, eq, value = arg.partition("=")
+            if key in ("--working-dir", "--max-turns"):
+                if not eq:
+                    i += 1
+                    value = argv[i]
+                if key == "--working-dir":
+                    args.working_dir = Path(value)
+                else:
+                    args.max_turns = int(value)
+            elif arg == "--verbose":
+                args.verbose = True
+            elif arg.startswith("-") or args.prompt is not None:
+                # --help, unknown flags and extra positionals
+                return _build_parser().parse_args(argv)
+            else:
+                args.prompt = arg
+            i += 1
+    except (IndexError, ValueError):
+        return _build_parser().parse_args(argv)
+    return args
+
+
+async def main():
+    """Main entry point"""
+    args = parse_args(sys.argv[1:])
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
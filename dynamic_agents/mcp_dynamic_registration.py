@@ -15,6 +15,11 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MCPDynamicRegistration:
     """Utilities for dynamically registering MCP servers"""
@@ -22,6 +27,38 @@ class MCPDynamicRegistration:
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.mcp_config_path = project_root / ".mcp.json"
+        self._config: Optional[Dict[str, Any]] = None
+        self._config_mtime_ns: Optional[int] = None
+        
+    def _load_config(self) -> Dict[str, Any]:
+        """Load existing config, reusing the parsed copy while the file is unchanged"""
+        try:
+            mtime_ns = self.mcp_config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {"mcpServers": {}}
+        
+        if self._config is None or self._config_mtime_ns != mtime_ns:
+            if orjson is not None:
+                self._config = orjson.loads(self.mcp_config_path.read_bytes())
+            else:
+                with open(self.mcp_config_path, 'r') as f:
+                    self._config = json.load(f)
+            self._config_mtime_ns = mtime_ns
+        return self._config
+    
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """Write config atomically and remember it as the cached copy"""
+        # Leave an identical file alone so its mtime (and Claude's parsed copy) stay valid
+        if self.mcp_config_path.exists() and config == self._load_config():
+            return
+        
+        # Readers (including Claude) see either the old or the new file, never a torn one
+        tmp_path = self.mcp_config_path.with_name(self.mcp_config_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_path, self.mcp_config_path)
+        self._config = config
+        self._config_mtime_ns = self.mcp_config_path.stat().st_mtime_ns
         
     def create_mcp_config(self, servers: Dict[str, Any]) -> None:
         """Create or update .mcp.json configuration file"""
@@ -30,25 +67,23 @@ class MCPDynamicRegistration:
         }
         
         # Write configuration
-        with open(self.mcp_config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        self._write_config(config)
             
     def add_server_to_config(self, name: str, server_config: Dict[str, Any]) -> None:
         """Add a single server to existing configuration"""
+        self.add_servers_to_config({name: server_config})
+    
+    def add_servers_to_config(self, servers: Dict[str, Dict[str, Any]]) -> None:
+        """Add several servers to existing configuration with a single write"""
         
         # Load existing config if it exists
-        if self.mcp_config_path.exists():
-            with open(self.mcp_config_path, 'r') as f:
-                config = json.load(f)
-        else:
-            config = {"mcpServers": {}}
+        config = self._load_config()
         
-        # Add new server
-        config["mcpServers"][name] = server_config
+        # Merge new servers into a copy, keeping the cached config comparable
+        config = {**config, "mcpServers": {**config.get("mcpServers", {}), **servers}}
         
         # Write back
-        with open(self.mcp_config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        self._write_config(config)
     
     def register_stdio_server(self, name: str, command: str, args: list = None, env: dict = None) -> Dict[str, Any]:
         """Register a stdio MCP server"""
@@ -73,6 +108,16 @@ class MCPDynamicRegistration:
         self.add_server_to_config(name, server_config)
         return server_config
     
+    def register_generated_mcp_servers(self, servers: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Register several generated MCP servers in one config update"""
+        server_configs = {
+            name: {"command": "node", "args": [str(server_path)]}
+            for name, server_path in servers.items()
+        }
+        
+        self.add_servers_to_config(server_configs)
+        return server_configs
+    
     def get_allowed_tools_for_sdk(self, include_mcp_server: str) -> list:
         """Get list of allowed tools including MCP server tools"""
         
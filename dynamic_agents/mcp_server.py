@@ -7,26 +7,107 @@ Tools can be added at runtime without restarting the server.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import math
+import os
+import re
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
 import importlib.util
+from importlib.machinery import ModuleSpec
 import sys
+import time
+import types
 
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog is optional; without it tools are picked up by periodic rescans
+    FileSystemEventHandler = object
+    Observer = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Pretty-printed tool results are much slower to encode; only use them when debugging
+DEBUG = bool(os.environ.get('DYNAMIC_AGENTS_DEBUG'))
+
 TOOLS_DIR = Path(__file__).parent / "generated_tools"
 TOOL_MODULES_DIR = Path(__file__).parent / "tool_modules"
 
+# The MCP SDK is imported on first use so ToolRegistry can be used without it
+_Tool = None
+
+
+def _get_tool_cls():
+    """Import mcp.types.Tool once and cache it"""
+    global _Tool
+    if _Tool is None:
+        from mcp.types import Tool
+        _Tool = Tool
+    return _Tool
+
+
+def _cached_import(module_name: str, path: Path, mtime_ns: int, spec: Optional[ModuleSpec] = None):
+    """Import a tool module, reusing the sys.modules entry while its file is unchanged"""
+    cached = sys.modules.get(module_name)
+    if (cached is not None
+            and getattr(cached, '__file__', None) == str(path)
+            and getattr(cached, '_tool_mtime_ns', -1) >= mtime_ns):
+        return cached
+    
+    # Stale or never loaded - run the loader, building a spec only if needed
+    sys.modules.pop(module_name, None)
+    if spec is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+    if not (spec and spec.loader):
+        return None
+    
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    module._tool_mtime_ns = mtime_ns
+    return module
+
+
+TOOL_DISCOVERY_NAME = "tool_discovery"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+
+# BM25F parameters: per-field weight and length normalisation
+_BM25_K1 = 1.2
+_BM25F_FIELDS = {
+    'name': (3.0, 0.3),
+    'tags': (2.0, 0.0),
+    'search_hint': (2.0, 0.5),
+    'param_names': (1.5, 0.3),
+    'description': (1.0, 0.75),
+}
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens; splits snake_case and kebab-case names"""
+    return _TOKEN_RE.findall(text.lower())
+
 
 @dataclass
 class DynamicTool:
@@ -36,141 +117,458 @@ class DynamicTool:
     input_schema: Dict[str, Any]
     implementation: Optional[str] = None
     module_path: Optional[Path] = None
-    last_modified: Optional[datetime] = None
-    
-    def to_mcp_tool(self) -> Tool:
-        """Convert to MCP Tool format"""
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema=self.input_schema
+    last_modified: int = 0  # st_mtime_ns of the source file
+    tags: List[str] = field(default_factory=list)
+    search_hint: str = ""
+    defer: bool = False  # list only a summary; full schema via tool_discovery
+    handler: Optional[Callable[[Any], Any]] = field(default=None, repr=False, compare=False)
+    compiled: Optional[types.CodeType] = field(default=None, repr=False, compare=False)
+    _mcp_tool: Optional["Tool"] = field(default=None, repr=False, compare=False)
+    
+    @classmethod
+    def from_definition(cls, tool_def: Dict[str, Any], default_name: str, **kwargs) -> "DynamicTool":
+        """Build a tool from a JSON definition or a module's TOOL_DEFINITION"""
+        return cls(
+            name=tool_def.get('name', default_name),
+            description=tool_def.get('description', ''),
+            input_schema=tool_def.get('inputSchema', {'type': 'object', 'properties': {}}),
+            tags=list(tool_def.get('tags', [])),
+            search_hint=tool_def.get('search_hint', ''),
+            defer=bool(tool_def.get('defer', False)),
+            **kwargs
         )
+    
+    @property
+    def summary(self) -> str:
+        """First sentence of the description"""
+        return _SENTENCE_END_RE.split(self.description.strip(), 1)[0]
+    
+    def search_fields(self) -> Dict[str, str]:
+        """Text of each field used for tool discovery"""
+        return {
+            'name': self.name,
+            'tags': ' '.join(self.tags),
+            'search_hint': self.search_hint,
+            'param_names': ' '.join(self.input_schema.get('properties', {})),
+            'description': self.description,
+        }
+    
+    def to_schema(self) -> Dict[str, Any]:
+        """Full definition as returned by tool_discovery"""
+        return {
+            'name': self.name,
+            'description': self.description,
+            'inputSchema': self.input_schema,
+        }
+    
+    def to_mcp_tool(self) -> "Tool":
+        """Convert to MCP Tool format (a stub for deferred tools)"""
+        if self._mcp_tool is None:
+            if self.defer:
+                self._mcp_tool = _get_tool_cls()(
+                    name=self.name,
+                    description=f"{self.summary} (call {TOOL_DISCOVERY_NAME} for the full schema)",
+                    inputSchema={'type': 'object'}
+                )
+            else:
+                self._mcp_tool = _get_tool_cls()(
+                    name=self.name,
+                    description=self.description,
+                    inputSchema=self.input_schema
+                )
+        return self._mcp_tool
 
 
 class ToolRegistry:
     """High-level tool registry with caching and hot-reload support"""
     
-    def __init__(self, tools_dir: Path, modules_dir: Path):
+    def __init__(self, tools_dir: Path, modules_dir: Path, rescan_interval: float = 2.0):
         self.tools_dir = tools_dir
         self.modules_dir = modules_dir
         self.tools: Dict[str, DynamicTool] = {}
-        self._last_scan = datetime.min
+        self.rescan_interval = rescan_interval
+        self._sources: Dict[Path, str] = {}  # source file -> tool name
+        self._by_canonical_name: Dict[str, str] = {}  # file stem -> tool name, when they differ
+        self._tools_snapshot: Optional[Tuple[DynamicTool, ...]] = None
+        # BM25F statistics, maintained as tools are (re)loaded: per-field term
+        # frequencies and lengths per tool, term -> tool names, and field length totals
+        self._tf: Dict[str, Dict[str, Counter]] = {}
+        self._dl: Dict[str, Dict[str, int]] = {}
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._field_len_total: Counter = Counter()
+        self._mcp_tools: Optional[List["Tool"]] = None
+        self._io_semaphore = asyncio.BoundedSemaphore(64)
+        self._spec_cache: Dict[Path, ModuleSpec] = {}
+        
+        # Built-in meta-tool for progressive disclosure of deferred schemas
+        self.tools[TOOL_DISCOVERY_NAME] = DynamicTool(
+            name=TOOL_DISCOVERY_NAME,
+            description=(
+                "Find tools and fetch their full input schemas. "
+                "Pass 'name' for an exact tool or 'query' to search names, descriptions and tags."
+            ),
+            input_schema={
+                'type': 'object',
+                'properties': {
+                    'name': {'type': 'string', 'description': 'Exact tool name'},
+                    'query': {'type': 'string', 'description': 'Free-text search'},
+                    'limit': {'type': 'integer', 'description': 'Maximum results (default 5)'},
+                },
+            },
+            handler=self.discover,
+        )
+        self._dir_mtimes: Dict[Path, int] = {}
+        self._last_scan = float('-inf')
+        
+    @staticmethod
+    def _dir_mtime_ns(directory: Path) -> int:
+        """Get a directory's mtime, creating the directory if needed"""
+        try:
+            return directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            directory.mkdir(parents=True, exist_ok=True)
+            return directory.stat().st_mtime_ns
         
     async def scan_and_load_tools(self, force: bool = False) -> None:
         """Scan directories and load/reload tools"""
-        # Ensure directories exist
-        self.tools_dir.mkdir(parents=True, exist_ok=True)
-        self.modules_dir.mkdir(parents=True, exist_ok=True)
+        tools_mtime = self._dir_mtime_ns(self.tools_dir)
+        modules_mtime = self._dir_mtime_ns(self.modules_dir)
+        
+        # A directory's mtime only moves when entries are added, removed or
+        # renamed. In-place edits are picked up by the periodic full rescan.
+        full_scan = force or time.monotonic() - self._last_scan >= self.rescan_interval
+        reload_json = full_scan or self._dir_mtimes.get(self.tools_dir) != tools_mtime
+        reload_modules = full_scan or self._dir_mtimes.get(self.modules_dir) != modules_mtime
+        if not (reload_json or reload_modules):
+            return
         
         # Load JSON-based tools
-        await self._load_json_tools()
+        if reload_json:
+            await self._load_json_tools()
+            self._dir_mtimes[self.tools_dir] = tools_mtime
         
         # Load Python module-based tools
-        await self._load_module_tools()
+        if reload_modules:
+            await self._load_module_tools()
+            self._dir_mtimes[self.modules_dir] = modules_mtime
         
-        self._last_scan = datetime.now()
+        if full_scan:
+            self._last_scan = time.monotonic()
         logger.info(f"Loaded {len(self.tools)} tools")
     
+    def _is_fresh(self, path: Path, mtime_ns: int) -> bool:
+        """Check whether the tool loaded from path is already up to date"""
+        name = self._sources.get(path)
+        return name in self.tools and self.tools[name].last_modified >= mtime_ns
+    
+    def _add_tool(self, path: Path, tool: DynamicTool) -> None:
+        """Register a tool and remember which file it came from"""
+        old_name = self._sources.get(path)
+        if old_name is not None and old_name != tool.name:
+            self.tools.pop(old_name, None)
+            self._unindex_tool(old_name)
+        self._sources[path] = tool.name
+        self.tools[tool.name] = tool
+        self._index_tool(tool)
+        if path.stem != tool.name:
+            self._by_canonical_name[path.stem] = tool.name
+        else:
+            self._by_canonical_name.pop(path.stem, None)
+        self._registry_changed()
+    
+    def _remove_source(self, path: Path) -> None:
+        """Drop the tool that was loaded from a deleted file"""
+        name = self._sources.pop(path, None)
+        self._by_canonical_name.pop(path.stem, None)
+        if name is not None and self.tools.pop(name, None) is not None:
+            self._unindex_tool(name)
+            self._registry_changed()
+            logger.info(f"Removed tool: {name}")
+    
+    def _registry_changed(self) -> None:
+        """Invalidate views derived from self.tools"""
+        self._tools_snapshot = None
+        self._mcp_tools = None
+    
+    def _index_tool(self, tool: DynamicTool) -> None:
+        """Tokenize a tool's search fields once and add them to the BM25F statistics"""
+        self._unindex_tool(tool.name)
+        tf = {f: Counter(_tokenize(text)) for f, text in tool.search_fields().items()}
+        dl = {f: sum(counts.values()) for f, counts in tf.items()}
+        self._tf[tool.name] = tf
+        self._dl[tool.name] = dl
+        self._field_len_total.update(dl)
+        for counts in tf.values():
+            for term in counts:
+                self._postings[term].add(tool.name)
+    
+    def _unindex_tool(self, name: str) -> None:
+        """Remove a tool's contribution to the BM25F statistics"""
+        tf = self._tf.pop(name, None)
+        if tf is None:
+            return
+        self._field_len_total.subtract(self._dl.pop(name))
+        for counts in tf.values():
+            for term in counts:
+                names = self._postings.get(term)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._postings[term]
+    
     async def _load_json_tools(self) -> None:
-        """Load tools from JSON definitions"""
-        for json_file in self.tools_dir.glob("*.json"):
+        """Load tools from JSON definitions, reading changed files concurrently"""
+        with os.scandir(self.tools_dir) as entries:
+            json_entries = [e for e in entries if e.name.endswith('.json') and e.is_file()]
+        
+        stale = []
+        for entry in json_entries:
             try:
-                mtime = datetime.fromtimestamp(json_file.stat().st_mtime)
-                tool_name = json_file.stem
-                
-                # Skip if not modified
-                if tool_name in self.tools and self.tools[tool_name].last_modified >= mtime:
-                    continue
-                
-                with open(json_file, 'r') as f:
-                    tool_def = json.load(f)
-                
-                tool = DynamicTool(
-                    name=tool_def.get('name', tool_name),
-                    description=tool_def.get('description', ''),
-                    input_schema=tool_def.get('inputSchema', {'type': 'object', 'properties': {}}),
-                    implementation=tool_def.get('implementation'),
-                    last_modified=mtime
-                )
-                
-                self.tools[tool.name] = tool
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError as e:
+                logger.error(f"Failed to load tool {entry.path}: {e}")
+                continue
+            json_file = Path(entry.path)
+            # Skip if not modified
+            if not self._is_fresh(json_file, mtime_ns):
+                stale.append((json_file, mtime_ns))
+        
+        tools = await asyncio.gather(*(self._read_json_tool_async(f, m) for f, m in stale))
+        for (json_file, _), tool in zip(stale, tools):
+            if tool is not None:
+                self._add_tool(json_file, tool)
                 logger.info(f"Loaded JSON tool: {tool.name}")
-                
+    
+    async def _read_json_tool_async(self, json_file: Path, mtime_ns: int) -> Optional[DynamicTool]:
+        """Read a JSON tool definition in a worker thread"""
+        async with self._io_semaphore:
+            try:
+                return await asyncio.to_thread(self._read_json_tool, json_file, mtime_ns)
             except Exception as e:
                 logger.error(f"Failed to load tool {json_file}: {e}")
+                return None
+    
+    @staticmethod
+    def _read_json_tool(json_file: Path, mtime_ns: int) -> DynamicTool:
+        """Parse a JSON tool definition into a DynamicTool"""
+        if orjson is not None:
+            tool_def = orjson.loads(json_file.read_bytes())
+        else:
+            with open(json_file, 'r') as f:
+                tool_def = json.load(f)
+        
+        tool = DynamicTool.from_definition(
+            tool_def,
+            json_file.stem,
+            implementation=tool_def.get('implementation'),
+            last_modified=mtime_ns
+        )
+        if tool.implementation:
+            # Compile once per reload rather than on every call
+            tool.compiled = compile(tool.implementation, f"<tool:{tool.name}>", "exec")
+        return tool
+    
+    def _load_json_file(self, json_file: Path, mtime_ns: int) -> None:
+        """Load a single JSON tool definition unless it is unchanged"""
+        # Skip if not modified
+        if self._is_fresh(json_file, mtime_ns):
+            return
+        
+        tool = self._read_json_tool(json_file, mtime_ns)
+        self._add_tool(json_file, tool)
+        logger.info(f"Loaded JSON tool: {tool.name}")
     
     async def _load_module_tools(self) -> None:
         """Load tools from Python modules"""
-        for py_file in self.modules_dir.glob("*.py"):
-            if py_file.name.startswith('_'):
-                continue
-                
+        with os.scandir(self.modules_dir) as entries:
+            py_entries = [
+                e for e in entries
+                if e.name.endswith('.py') and not e.name.startswith('_') and e.is_file()
+            ]
+        
+        for entry in py_entries:
             try:
-                mtime = datetime.fromtimestamp(py_file.stat().st_mtime)
-                module_name = py_file.stem
-                
-                # Skip if not modified
-                if module_name in self.tools and self.tools[module_name].last_modified >= mtime:
-                    continue
-                
-                # Dynamic import
-                spec = importlib.util.spec_from_file_location(module_name, py_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[module_name] = module
-                    spec.loader.exec_module(module)
-                    
-                    # Extract tool definition
-                    if hasattr(module, 'TOOL_DEFINITION'):
-                        tool_def = module.TOOL_DEFINITION
-                        tool = DynamicTool(
-                            name=tool_def.get('name', module_name),
-                            description=tool_def.get('description', ''),
-                            input_schema=tool_def.get('inputSchema', {'type': 'object', 'properties': {}}),
-                            module_path=py_file,
-                            last_modified=mtime
-                        )
-                        
-                        self.tools[tool.name] = tool
-                        logger.info(f"Loaded Python tool: {tool.name}")
-                
+                self._load_module_file(Path(entry.path), entry.stat().st_mtime_ns)
             except Exception as e:
-                logger.error(f"Failed to load module {py_file}: {e}")
+                logger.error(f"Failed to load module {entry.path}: {e}")
+    
+    def _load_module_file(self, py_file: Path, mtime_ns: int) -> None:
+        """Import a single Python tool module unless it is unchanged"""
+        # Skip if not modified
+        if self._is_fresh(py_file, mtime_ns):
+            return
+        
+        # Dynamic import
+        module_name = py_file.stem
+        spec = self._spec_cache.get(py_file)
+        if spec is None:
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            if spec is not None:
+                self._spec_cache[py_file] = spec
+        module = _cached_import(module_name, py_file, mtime_ns, spec)
+        
+        # Extract tool definition
+        if module is not None and hasattr(module, 'TOOL_DEFINITION'):
+            tool_def = module.TOOL_DEFINITION
+            tool = DynamicTool.from_definition(
+                tool_def,
+                module_name,
+                module_path=py_file,
+                last_modified=mtime_ns
+            )
+            
+            self._add_tool(py_file, tool)
+            logger.info(f"Loaded Python tool: {tool.name}")
+    
+    async def reload_file(self, path: Path) -> None:
+        """Reload, or drop, the tool defined by a single changed file"""
+        if path.parent == self.tools_dir and path.suffix == '.json':
+            loader = self._load_json_file
+        elif path.parent == self.modules_dir and path.suffix == '.py' and not path.name.startswith('_'):
+            loader = self._load_module_file
+        else:
+            return
+        
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._remove_source(path)
+            return
+        
+        try:
+            loader(path, mtime_ns)
+        except Exception as e:
+            logger.error(f"Failed to reload {path}: {e}")
     
     def get_tool(self, name: str) -> Optional[DynamicTool]:
-        """Get a tool by name"""
-        return self.tools.get(name)
+        """Get a tool by name (or by its file stem)"""
+        tool = self.tools.get(name)
+        if tool is None and name in self._by_canonical_name:
+            tool = self.tools.get(self._by_canonical_name[name])
+        return tool
     
-    def list_tools(self) -> List[DynamicTool]:
+    def list_tools(self) -> Tuple[DynamicTool, ...]:
         """List all available tools"""
-        return list(self.tools.values())
+        if self._tools_snapshot is None:
+            self._tools_snapshot = tuple(self.tools.values())
+        return self._tools_snapshot
+    
+    def discover(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Return full schemas for a named tool or the best matches for a query"""
+        arguments = arguments or {}
+        name = arguments.get('name')
+        if name:
+            tool = self.get_tool(name)
+            if tool is None:
+                raise ValueError(f"Tool '{name}' not found")
+            return {'tools': [tool.to_schema()]}
+        
+        matches = self.search(arguments.get('query', ''), int(arguments.get('limit', 5)))
+        return {'tools': [tool.to_schema() for tool in matches]}
+    
+    def bm25_search(self, query: str, k: int = 5) -> List[str]:
+        """Return the names of the top-k tools for a free-text query, best first"""
+        n = len(self._tf)
+        if not n:
+            return []
+        avg_len = {f: (self._field_len_total[f] / n) or 1.0 for f in _BM25F_FIELDS}
+        
+        scores: Dict[str, float] = defaultdict(float)
+        for term in set(_tokenize(query)):
+            names = self._postings.get(term)
+            if not names:
+                continue
+            idf = math.log((n - len(names) + 0.5) / (len(names) + 0.5) + 1)
+            for name in names:
+                # Field-weighted, length-normalised term frequency
+                tf = 0.0
+                for f, (weight, b) in _BM25F_FIELDS.items():
+                    count = self._tf[name][f].get(term)
+                    if count:
+                        tf += weight * count / (1 - b + b * self._dl[name][f] / avg_len[f])
+                scores[name] += idf * tf / (_BM25_K1 + tf)
+        
+        ranked = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [name for name, _ in ranked]
+    
+    def search(self, query: str, k: int = 5) -> List[DynamicTool]:
+        """Return the top-k tools for a free-text query, best first"""
+        return [self.tools[name] for name in self.bm25_search(query, k)]
+    
+    def list_mcp_tools(self) -> List["Tool"]:
+        """List all tools in MCP format, rebuilt only after the registry changes"""
+        if self._mcp_tools is None:
+            self._mcp_tools = [tool.to_mcp_tool() for tool in self.list_tools()]
+        return self._mcp_tools
+
+
+class _ToolDirEventHandler(FileSystemEventHandler):
+    """Forwards watchdog file events to the server's event loop"""
+    
+    def __init__(self, server: "DynamicToolServer", loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self.server = server
+        self.loop = loop
+    
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if path:
+                self.loop.call_soon_threadsafe(self.server._schedule_reload, Path(path))
 
 
 class DynamicToolServer:
     """High-level MCP server implementation"""
     
     def __init__(self):
+        from mcp.server import Server
+        
         self.server = Server("dynamic-tools-python")
         self.registry = ToolRegistry(TOOLS_DIR, TOOL_MODULES_DIR)
+        self._observer = None
+        self._reload_tasks = set()
         self._setup_handlers()
     
+    def _start_watcher(self) -> None:
+        """Watch the tool directories so changes are reloaded as they happen"""
+        if Observer is None:
+            logger.info("watchdog not installed - falling back to periodic rescans")
+            return
+        
+        handler = _ToolDirEventHandler(self, asyncio.get_running_loop())
+        observer = Observer()
+        observer.schedule(handler, str(self.registry.tools_dir))
+        observer.schedule(handler, str(self.registry.modules_dir))
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+    
+    def _schedule_reload(self, path: Path) -> None:
+        """Reload a single file on the event loop (called from the watcher thread)"""
+        task = asyncio.create_task(self.registry.reload_file(path))
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_tasks.discard)
+    
     def _setup_handlers(self):
         """Setup MCP request handlers"""
+        from mcp.types import TextContent
         
         @self.server.list_tools()
         async def list_tools():
             """List all available tools"""
-            # Reload tools on each request
-            await self.registry.scan_and_load_tools()
+            # Without a file watcher, fall back to a (throttled) rescan
+            if self._observer is None:
+                await self.registry.scan_and_load_tools()
             
-            tools = [tool.to_mcp_tool() for tool in self.registry.list_tools()]
-            return tools
+            return self.registry.list_mcp_tools()
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Any):
             """Execute a tool"""
-            # Reload to get latest version
-            await self.registry.scan_and_load_tools()
+            # Without a file watcher, fall back to a (throttled) rescan
+            if self._observer is None:
+                await self.registry.scan_and_load_tools()
             
             tool = self.registry.get_tool(name)
             if not tool:
@@ -178,14 +576,22 @@ class DynamicToolServer:
             
             try:
                 result = await self._execute_tool(tool, arguments)
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                if DEBUG:
+                    text = json.dumps(result, indent=2)
+                else:
+                    text = json.dumps(result, separators=(',', ':'), ensure_ascii=False)
+                return [TextContent(type="text", text=text)]
             except Exception as e:
                 logger.error(f"Tool execution failed: {e}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
     
     async def _execute_tool(self, tool: DynamicTool, arguments: Any) -> Any:
         """Execute a tool with given arguments"""
-        if tool.module_path:
+        if tool.handler:
+            # Built-in tool implemented by the server itself
+            return tool.handler(arguments)
+        
+        elif tool.module_path:
             # Execute Python module-based tool
             module_name = tool.module_path.stem
             if module_name in sys.modules:
@@ -198,7 +604,7 @@ class DynamicToolServer:
             # Execute JSON-defined implementation (simplified)
             # In production, use a proper sandboxed execution environment
             namespace = {'args': arguments, 'result': None}
-            exec(tool.implementation, namespace)
+            exec(tool.compiled, namespace)
             return namespace.get('result', {'status': 'completed'})
         
         else:
@@ -206,18 +612,25 @@ class DynamicToolServer:
     
     async def run(self):
         """Run the MCP server"""
+        from mcp.server.stdio import stdio_server
+        
         logger.info("Starting Dynamic Tool MCP Server (Python)")
         
         # Initial tool load
-        await self.registry.scan_and_load_tools()
+        await self.registry.scan_and_load_tools(force=True)
+        self._start_watcher()
         
         # Run the server
-        async with stdio_server() as streams:
-            await self.server.run(
-                streams[0],  # stdin
-                streams[1],  # stdout
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as streams:
+                await self.server.run(
+                    streams[0],  # stdin
+                    streams[1],  # stdout
+                    self.server.create_initialization_options()
+                )
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
 
 
 async def main():
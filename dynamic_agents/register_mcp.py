@@ -3,8 +3,27 @@
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def _register_one(server_file):
+    """Register a single MCP server, returning (name, success, message)"""
+    server_name = server_file.stem.replace('_', '-')  # Convert underscores to hyphens
+    server_path = str(server_file.absolute())
+    
+    # Build claude mcp add command (same pattern that worked before)
+    cmd = ['claude', 'mcp', 'add', server_name, '--', 'python', server_path]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    
+    if result.returncode == 0:
+        return server_name, True, f"  ✅ {server_name} registered successfully"
+    
+    error_msg = result.stderr.strip()
+    if "already exists" in error_msg:
+        return server_name, True, f"  ℹ️  {server_name} already registered"
+    # Don't fail the whole process if one server fails
+    return server_name, False, f"  ❌ Failed to register {server_name}: {error_msg}"
+
 def register_mcp_servers():
     """Auto-discover and register MCP servers from dynamic_agents/generated_mcp/"""
     
@@ -28,29 +47,18 @@ def register_mcp_servers():
         
     print(f"🔌 Auto-discovering and registering {len(server_files)} MCP servers...")
     
-    success_count = 0
-    
     for server_file in server_files:
-        server_name = server_file.stem.replace('_', '-')  # Convert underscores to hyphens
-        server_path = str(server_file.absolute())
-        
-        # Build claude mcp add command (same pattern that worked before)
-        cmd = ['claude', 'mcp', 'add', server_name, '--', 'python', server_path]
-        
-        print(f"  Registering: {server_name} from {server_file.name}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"  ✅ {server_name} registered successfully")
+        print(f"  Registering: {server_file.stem.replace('_', '-')} from {server_file.name}")
+    
+    # Each registration is a separate CLI process, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_register_one, server_files))
+    
+    success_count = 0
+    for server_name, success, message in sorted(results):
+        print(message)
+        if success:
             success_count += 1
-        else:
-            error_msg = result.stderr.strip()
-            if "already exists" in error_msg:
-                print(f"  ℹ️  {server_name} already registered")
-                success_count += 1
-            else:
-                print(f"  ❌ Failed to register {server_name}: {error_msg}")
-                # Don't fail the whole process if one server fails
     
     print(f"\n🎉 {success_count}/{len(server_files)} servers registered successfully")
     return success_count > 0
@@ -7,9 +7,85 @@ Triggers when meta-agent finishes creating new subagent
 import json
 import sys
 import os
-import subprocess
-import tempfile
-from pathlib import Path
+import re
+import select
+import time
+
+DEBUG = bool(os.environ.get('DYNAMIC_AGENTS_DEBUG'))
+
+# Indicators in the meta-agent result that a new agent was created
+_CREATED_RE = re.compile(r'agent created|generated|specialized agent|subagent|created', re.IGNORECASE)
+
+def _wait_for_exit(pid, timeout):
+    """Block until pid exits or timeout elapses; returns True if it exited"""
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    if pidfd is not None:
+        # The pidfd turns readable the moment the process exits
+        try:
+            return bool(select.select([pidfd], [], [], timeout)[0])
+        finally:
+            os.close(pidfd)
+    
+    # No pidfd (non-Linux or old kernel): poll with a short, growing backoff
+    deadline = time.monotonic() + timeout
+    interval = 0.05
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.5)
+
+def _find_session_pid():
+    """Walk up from the hook's parent to the claude process; None if it can't be identified"""
+    # Hooks may run under an `sh -c` wrapper, so the direct parent isn't necessarily claude
+    pid = os.getppid()
+    while pid > 1:
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                argv = f.read().split(b'\0')
+            with open(f'/proc/{pid}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            return None
+        # Native builds run as argv[0]; the npm build runs as `node .../claude`
+        if any(os.path.basename(arg) == b'claude' for arg in argv[:2]):
+            return pid
+        # Field 4 of /proc/<pid>/stat is the parent pid; comm (field 2) may contain spaces
+        pid = int(stat[stat.rindex(b')') + 2:].split()[1])
+    return None
+
+def _spawn_delayed_restart(working_dir, delay=2):
+    """Fork a detached child that waits (up to delay seconds) for this session to exit, then runs claude --continue"""
+    # Capture the session before setsid reparents us
+    session_pid = _find_session_pid()
+    if os.fork():
+        return
+    
+    # Child: never return into the hook's control flow
+    try:
+        os.setsid()
+        os.chdir(working_dir)
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        if session_pid is not None:
+            _wait_for_exit(session_pid, delay)
+        else:
+            # Session process unknown (no /proc): fall back to the fixed delay
+            time.sleep(delay)
+        os.execvp('claude', ['claude', '--continue'])
+    finally:
+        os._exit(1)
 
 def main():
     """Hook script for restarting after meta-agent creates subagent"""
@@ -21,10 +97,12 @@ def main():
         except json.JSONDecodeError:
             # If no JSON data, read raw input
             raw_input = sys.stdin.read()
-            print(f"Hook received raw input: {raw_input}", file=sys.stderr)
+            if DEBUG:
+                print("Hook received raw input:", raw_input, file=sys.stderr)
             hook_data = {}
         
-        print(f"Hook received data: {json.dumps(hook_data, indent=2)}", file=sys.stderr)
+        if DEBUG:
+            print("Hook received data:", json.dumps(hook_data, separators=(',', ':')), file=sys.stderr)
         
         # Check if this was a meta-agent subagent task
         subagent_type = hook_data.get('subagent_type', '')
@@ -37,9 +115,7 @@ def main():
         # Check if new agent was likely created
         # Look for indicators in the result or assume meta-agent created something
         likely_created = (
-            any(keyword in task_result.lower() for keyword in [
-                'agent created', 'generated', 'specialized agent', 'subagent', 'created'
-            ]) or 
+            bool(_CREATED_RE.search(task_result)) or 
             len(task_result) > 50  # Assume substantial output means agent was created
         )
         
@@ -51,46 +127,10 @@ def main():
             print("🔄 Meta-agent finished - new subagent created!")
             print("🔄 Triggering restart to load new agent...")
             
-            # Create restart script
-            restart_script = tempfile.NamedTemporaryFile(
-                mode='w', 
-                suffix='.sh',
-                prefix='dynamic_restart_',
-                delete=False
-            )
-            
-            restart_script.write(f'''#!/bin/bash
-# Dynamic Agent Restart Script
-echo "🔄 Restarting Claude Code to load new subagent..."
-
-# Wait for current process to exit
-sleep 2
-
-# Change to working directory
-cd "{working_dir}"
-
-# Restart Claude Code with continuation
-claude --continue
-
-echo "✅ Claude Code restarted with new subagent available!"
-
-# Clean up
-rm -f "{restart_script.name}"
-''')
-            
-            restart_script.flush()
-            restart_script.close()
-            
-            # Make executable
-            os.chmod(restart_script.name, 0o755)
-            
-            print(f"🚀 Executing restart script: {restart_script.name}")
+            print("🚀 Scheduling Claude Code restart with new subagent available")
             
-            # Execute restart script in background
-            subprocess.Popen([restart_script.name], 
-                           stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL,
-                           start_new_session=True)
+            # Restart in a detached child once the current process has exited
+            _spawn_delayed_restart(working_dir)
             
             # Signal successful hook execution
             sys.exit(0)
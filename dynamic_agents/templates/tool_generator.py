@@ -2,10 +2,50 @@
 Tool Generator - Creates MCP tool definitions from specifications
 """
 
+import functools
 import json
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import re
+from string import Template
+
+
+# Map parameter types to Zod validators
+_ZOD_TYPES = {
+    'string': 'z.string()',
+    'number': 'z.number()',
+    'boolean': 'z.boolean()',
+    'array': 'z.array(z.string())',  # Default to string array
+    'object': 'z.object({}).passthrough()'
+}
+
+@functools.lru_cache(maxsize=32)
+def _read_template(path: str) -> str:
+    """Read a template file once per process"""
+    return Path(path).read_text()
+
+
+# Matches "// {{NAME_PLACEHOLDER}}" block markers and inline "{{NAME}}" markers
+_PLACEHOLDER_RE = re.compile(r'// \{\{(\w+)_PLACEHOLDER\}\}|\{\{(\w+)\}\}')
+
+_TOOL_TEMPLATE = Template('''
+server.tool(
+  "$name",
+  "$description",
+  $param_schema,
+  async ($param_destructure) => {
+    try {
+      $implementation
+    } catch (error) {
+      return {
+        content: [{
+          type: "text",
+          text: `Error in $name: $${error.message}`
+        }]
+      };
+    }
+  }
+);''')
 
 
 class MCPToolGenerator:
@@ -13,7 +53,7 @@ class MCPToolGenerator:
     
     def __init__(self, template_dir: Path):
         self.template_dir = template_dir
-        self.server_template = (template_dir / "mcp_server_template.js").read_text()
+        self.server_template = _read_template(str((template_dir / "mcp_server_template.js").resolve()))
         
     def generate_tool_code(self, tool_spec: Dict[str, Any]) -> str:
         """Generate JavaScript code for a single MCP tool"""
@@ -30,25 +70,13 @@ class MCPToolGenerator:
         param_names = list(parameters.keys()) if parameters else []
         param_destructure = f"{{ {', '.join(param_names)} }}" if param_names else "{}"
         
-        tool_code = f'''
-server.tool(
-  "{name}",
-  "{description}",
-  {param_schema},
-  async ({param_destructure}) => {{
-    try {{
-      {implementation}
-    }} catch (error) {{
-      return {{
-        content: [{{
-          type: "text",
-          text: `Error in {name}: ${{error.message}}`
-        }}]
-      }};
-    }}
-  }}
-);'''
-        return tool_code
+        return _TOOL_TEMPLATE.substitute(
+            name=name,
+            description=description,
+            param_schema=param_schema,
+            param_destructure=param_destructure,
+            implementation=implementation
+        )
     
     def _generate_zod_schema(self, parameters: Dict[str, Any]) -> str:
         """Generate Zod schema from parameter specification"""
@@ -62,24 +90,17 @@ server.tool(
             param_desc = param_spec.get('description', '')
             required = param_spec.get('required', True)
             
-            # Map types to Zod validators
-            zod_type = {
-                'string': 'z.string()',
-                'number': 'z.number()',
-                'boolean': 'z.boolean()',
-                'array': 'z.array(z.string())',  # Default to string array
-                'object': 'z.object({}).passthrough()'
-            }.get(param_type, 'z.string()')
+            parts = ['    ', param_name, ': ', _ZOD_TYPES.get(param_type, 'z.string()')]
             
             # Add optional modifier if not required
             if not required:
-                zod_type += '.optional()'
+                parts.append('.optional()')
                 
             # Add description
             if param_desc:
-                zod_type += f'.describe("{param_desc}")'
+                parts.append(f'.describe("{param_desc}")')
                 
-            schema_parts.append(f'    {param_name}: {zod_type}')
+            schema_parts.append(''.join(parts))
         
         return "{\n" + ",\n".join(schema_parts) + "\n  }"
     
@@ -96,18 +117,19 @@ server.tool(
         for tool_spec in tools:
             tool_codes.append(self.generate_tool_code(tool_spec))
         
-        # Replace placeholders in template
-        server_code = self.server_template
-        server_code = server_code.replace('{{SERVER_NAME}}', server_name)
-        server_code = server_code.replace('{{SERVER_DESCRIPTION}}', server_desc)
-        server_code = server_code.replace('// {{TOOLS_PLACEHOLDER}}', '\n'.join(tool_codes))
-        server_code = server_code.replace('// {{HELPERS_PLACEHOLDER}}', helpers)
-        
-        # Clean up unused placeholders
-        server_code = server_code.replace('// {{RESOURCES_PLACEHOLDER}}', '')
-        server_code = server_code.replace('// {{PROMPTS_PLACEHOLDER}}', '')
-        
-        return server_code
+        # Replace placeholders in template; unused ones are cleaned up
+        subs = {
+            'SERVER_NAME': server_name,
+            'SERVER_DESCRIPTION': server_desc,
+            'TOOLS': '\n'.join(tool_codes),
+            'HELPERS': helpers,
+            'RESOURCES': '',
+            'PROMPTS': ''
+        }
+        return _PLACEHOLDER_RE.sub(
+            lambda m: subs.get(m.group(1) or m.group(2), m.group(0)),
+            self.server_template
+        )
 
 
 # Example specifications for different tool types
@@ -4,22 +4,67 @@ High-level Tool Management System
 Provides a comprehensive interface for creating, managing, and deploying MCP tools.
 """
 
+import functools
 import json
+import mmap
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import tempfile
+import textwrap
 import subprocess
 import sys
 import logging
 from abc import ABC, abstractmethod
 import ast
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write JSON with two-space indentation, using orjson when it can encode obj"""
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects non-str keys and integers beyond 64 bits
+            pass
+    if data is None:
+        data = json.dumps(obj, indent=2).encode()
+    _write_bytes_atomic(path, data)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data in one call beside the target and rename it into place"""
+    # The tool loader watches these directories, so it must never see a partial file
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_syntax(source: str) -> None:
+    """Parse source once; raises SyntaxError if it is not valid Python"""
+    ast.parse(source)
+
+
 @dataclass
 class ToolSpecification:
     """High-level tool specification"""
@@ -45,7 +90,7 @@ class ToolSpecification:
         
         for param_name, param_info in self.parameters.items():
             if isinstance(param_info, dict):
-                properties[param_name] = param_info
+                properties[param_name] = dict(param_info)
                 if param_info.get('required', False):
                     required.append(param_name)
             else:
@@ -57,37 +102,30 @@ class ToolSpecification:
             "properties": properties,
             "required": required
         }
-
-
-class ToolImplementation(ABC):
-    """Abstract base for tool implementations"""
-    
-    @abstractmethod
-    async def execute(self, arguments: Dict[str, Any]) -> Any:
-        """Execute the tool with given arguments"""
-        pass
     
-    @abstractmethod
-    def validate(self) -> bool:
-        """Validate the implementation"""
-        pass
+    def to_input_schema_json(self) -> str:
+        """Input schema serialized for embedding in generated modules"""
+        return json.dumps(self.to_input_schema(), separators=(',', ':'))
 
 
-class PythonToolBuilder:
-    """Builds Python-based tools with high-level abstractions"""
-    
-    def __init__(self, spec: ToolSpecification):
-        self.spec = spec
-        self.template = '''"""
+def _render_tool_module(name: str, description: str, input_schema: str, implementation: str) -> str:
+    """Render a generated tool module; the f-string is compiled once with this function"""
+    return f'''"""
 {description}
 
 Auto-generated tool module
 """
 
+import json
+
+# Kept as a JSON string: decoding it is cheaper than compiling a large dict
+# literal, and JSON true/false/null would not be valid Python anyway
+_INPUT_SCHEMA_JSON = {input_schema!r}
+
 TOOL_DEFINITION = {{
     "name": "{name}",
     "description": "{description}",
-    "inputSchema": {input_schema}
+    "inputSchema": json.loads(_INPUT_SCHEMA_JSON)
 }}
 
 
@@ -95,121 +133,204 @@ async def execute(arguments: dict) -> dict:
     """Execute the {name} tool"""
     {implementation}
 '''
+
+
+def _extract_tool_def_metadata(path: Path) -> Dict[str, Any]:
+    """Read TOOL_DEFINITION from a tool module's header without loading the whole module"""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b'\nasync def')
+            header = mm[:end] if end != -1 else mm[:]
     
-    def build_from_function(self, func_code: str) -> str:
-        """Build tool module from function code"""
-        # Parse the function to ensure it's valid Python
-        try:
-            ast.parse(func_code)
-        except SyntaxError as e:
-            raise ValueError(f"Invalid Python code: {e}")
-        
-        # Indent the implementation
-        implementation = '\n    '.join(func_code.strip().split('\n'))
-        
-        return self.template.format(
-            name=self.spec.name,
-            description=self.spec.description,
-            input_schema=json.dumps(self.spec.to_input_schema(), indent=4),
-            implementation=implementation
-        )
-    
-    def build_from_template(self, template_name: str, context: Dict[str, Any]) -> str:
-        """Build tool from a predefined template"""
-        templates = {
-            "file_processor": self._file_processor_template,
-            "api_client": self._api_client_template,
-            "data_transformer": self._data_transformer_template,
-        }
-        
-        if template_name not in templates:
-            raise ValueError(f"Unknown template: {template_name}")
-        
-        return templates[template_name](context)
-    
-    def _file_processor_template(self, context: Dict[str, Any]) -> str:
-        """Template for file processing tools"""
-        implementation = f'''
-    from pathlib import Path
+    try:
+        body = ast.parse(header).body
+    except SyntaxError:
+        return {}
+    for node in body:
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == 'TOOL_DEFINITION' for t in node.targets)):
+            if not isinstance(node.value, ast.Dict):
+                return {}
+            # Keep only literal entries; inputSchema is decoded at import time
+            tool_def = {}
+            for key, value in zip(node.value.keys, node.value.values):
+                try:
+                    tool_def[ast.literal_eval(key)] = ast.literal_eval(value)
+                except ValueError:
+                    continue
+            return tool_def
+    return {}
+
+
+def _safe_inject(snippet: str, indent: int) -> str:
+    """Validate a user-supplied code snippet and indent it for splicing into a template body"""
+    snippet = textwrap.dedent(snippet).strip() or 'pass'
+    try:
+        _validate_syntax(snippet)
+    except SyntaxError as e:
+        raise ValueError(f"Invalid Python code: {e}")
+    return textwrap.indent(snippet, ' ' * indent) + '\n'
+
+
+# Fixed parts of the built-in templates; only the injected snippets need parsing
+_FILE_PROCESSOR_PREFIX = '''    from pathlib import Path
     import json
     
     filepath = Path(arguments.get('filepath', ''))
     operation = arguments.get('operation', 'read')
     
     if not filepath.exists():
-        return {{"error": f"File not found: {{filepath}}"}}
+        return {"error": f"File not found: {filepath}"}
     
     try:
         if operation == 'read':
             with open(filepath, 'r') as f:
                 content = f.read()
-            return {{"content": content}}
+            return {"content": content}
         elif operation == 'process':
             # Custom processing logic
-            {context.get('processing_logic', 'pass')}
-            return {{"status": "processed"}}
+'''
+_FILE_PROCESSOR_SUFFIX = '''            return {"status": "processed"}
     except Exception as e:
-        return {{"error": str(e)}}
+        return {"error": str(e)}
 '''
-        
-        return self.build_from_function(implementation)
-    
-    def _api_client_template(self, context: Dict[str, Any]) -> str:
-        """Template for API client tools"""
-        implementation = f'''
-    import aiohttp
+
+_API_CLIENT_BODY = '''    import aiohttp
     import json
     
-    url = arguments.get('url', '{context.get('base_url', '')}')
+    url = arguments.get('url', $BASE_URL)
     method = arguments.get('method', 'GET')
     data = arguments.get('data')
-    headers = arguments.get('headers', {{}})
+    headers = arguments.get('headers', {})
     
     async with aiohttp.ClientSession() as session:
         async with session.request(method, url, json=data, headers=headers) as response:
             result = await response.json()
-            return {{
+            return {
                 "status_code": response.status,
                 "data": result
-            }}
+            }
 '''
-        
-        return self.build_from_function(implementation)
-    
-    def _data_transformer_template(self, context: Dict[str, Any]) -> str:
-        """Template for data transformation tools"""
-        implementation = f'''
-    import json
+
+_DATA_TRANSFORMER_PREFIX = '''    import json
     from typing import Any, Dict, List
     
     data = arguments.get('data')
     transformation = arguments.get('transformation', 'none')
     
     if transformation == 'flatten':
-        # Flatten nested structure
-        def flatten(d, parent_key='', sep='_'):
-            items = []
-            for k, v in d.items():
-                new_key = f"{{parent_key}}{{sep}}{{k}}" if parent_key else k
-                if isinstance(v, dict):
-                    items.extend(flatten(v, new_key, sep=sep).items())
+        # Flatten nested structure iteratively so deep nesting can't hit the recursion limit
+        def flatten(d, sep='_'):
+            out = {}
+            # Stack of partially consumed item iterators keeps the depth-first key order
+            stack = [('', iter(d.items()))]
+            while stack:
+                parent_key, items = stack[-1]
+                for k, v in items:
+                    new_key = f"{parent_key}{sep}{k}" if parent_key else k
+                    if isinstance(v, dict):
+                        stack.append((new_key, iter(v.items())))
+                        break
+                    out[new_key] = v
                 else:
-                    items.append((new_key, v))
-            return dict(items)
+                    stack.pop()
+            return out
         
         result = flatten(data) if isinstance(data, dict) else data
     elif transformation == 'aggregate':
         # Aggregate list data
-        {context.get('aggregation_logic', 'result = data')}
-    else:
+'''
+_DATA_TRANSFORMER_SUFFIX = '''    else:
         result = data
     
-    return {{"result": result}}
+    return {"result": result}
 '''
-        
-        return self.build_from_function(implementation)
 
 
+class ToolImplementation(ABC):
+    """Abstract base for tool implementations"""
+    
+    @abstractmethod
+    async def execute(self, arguments: Dict[str, Any]) -> Any:
+        """Execute the tool with given arguments"""
+        pass
+    
+    @abstractmethod
+    def validate(self) -> bool:
+        """Validate the implementation"""
+        pass
+
+
+class PythonToolBuilder:
+    """Builds Python-based tools with high-level abstractions"""
+    
+    def __init__(self, spec: ToolSpecification):
+        self.spec = spec
+    
+    def build_from_function(self, func_code: str) -> str:
+        """Build tool module from function code"""
+        # Parse the function to ensure it's valid Python
+        try:
+            _validate_syntax(func_code)
+        except SyntaxError as e:
+            raise ValueError(f"Invalid Python code: {e}")
+        
+        # Indent the implementation
+        implementation = '\n    '.join(func_code.strip().split('\n'))
+        
+        return _render_tool_module(
+            name=self.spec.name,
+            description=self.spec.description,
+            input_schema=self.spec.to_input_schema_json(),
+            implementation=implementation
+        )
+    
+    def build_from_template(self, template_name: str, context: Dict[str, Any]) -> str:
+        """Build tool from a predefined template"""
+        templates = {
+            "file_processor": self._file_processor_template,
+            "api_client": self._api_client_template,
+            "data_transformer": self._data_transformer_template,
+        }
+        
+        if template_name not in templates:
+            raise ValueError(f"Unknown template: {template_name}")
+        
+        return templates[template_name](context)
+    
+    def _build_from_body(self, body: str) -> str:
+        """Render a module from an implementation body that is already indented and validated"""
+        return _render_tool_module(
+            name=self.spec.name,
+            description=self.spec.description,
+            input_schema=self.spec.to_input_schema_json(),
+            implementation=body.strip()
+        )
+    
+    def _file_processor_template(self, context: Dict[str, Any]) -> str:
+        """Template for file processing tools"""
+        return self._build_from_body(
+            _FILE_PROCESSOR_PREFIX
+            + _safe_inject(context.get('processing_logic', 'pass'), 12)
+            + _FILE_PROCESSOR_SUFFIX
+        )
+    
+    def _api_client_template(self, context: Dict[str, Any]) -> str:
+        """Template for API client tools"""
+        return self._build_from_body(
+            _API_CLIENT_BODY.replace('$BASE_URL', repr(context.get('base_url', '')))
+        )
+    
+    def _data_transformer_template(self, context: Dict[str, Any]) -> str:
+        """Template for data transformation tools"""
+        return self._build_from_body(
+            _DATA_TRANSFORMER_PREFIX
+            + _safe_inject(context.get('aggregation_logic', 'result = data'), 8)
+            + _DATA_TRANSFORMER_SUFFIX
+        )
+
 class ToolManager:
     """High-level tool management interface"""
     
@@ -219,6 +340,8 @@ class ToolManager:
         self.modules_dir = self.base_dir / "tool_modules"
         self.tools_dir.mkdir(exist_ok=True)
         self.modules_dir.mkdir(exist_ok=True)
+        # Tool file -> (st_mtime_ns, list_tools entry)
+        self._list_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
         
     def create_tool(self, spec: ToolSpecification, implementation: Union[str, Dict[str, Any]]) -> Path:
         """Create a new tool with the given specification"""
@@ -246,8 +369,7 @@ class ToolManager:
         
         # Save the module
         module_path = self.modules_dir / f"{spec.name}.py"
-        with open(module_path, 'w') as f:
-            f.write(module_content)
+        _write_bytes_atomic(module_path, module_content.encode())
         
         logger.info(f"Created Python tool: {spec.name} at {module_path}")
         return module_path
@@ -268,8 +390,7 @@ class ToolManager:
         }
         
         tool_path = self.tools_dir / f"{spec.name}.json"
-        with open(tool_path, 'w') as f:
-            json.dump(tool_def, f, indent=2)
+        _write_json(tool_path, tool_def)
         
         logger.info(f"Created JSON tool: {spec.name} at {tool_path}")
         return tool_path
@@ -278,31 +399,50 @@ class ToolManager:
         """List all available tools"""
         tools = []
         
-        # List JSON tools
-        for json_file in self.tools_dir.glob("*.json"):
+        # List JSON tools, re-reading only files that changed since the last call
+        json_files = list(self.tools_dir.glob("*.json"))
+        for stale in {p for p in self._list_cache if p.parent == self.tools_dir} - set(json_files):
+            del self._list_cache[stale]
+        
+        for json_file in json_files:
             try:
-                with open(json_file, 'r') as f:
-                    tool_def = json.load(f)
-                tools.append({
-                    "name": tool_def.get('name', json_file.stem),
-                    "type": "json",
-                    "path": str(json_file),
-                    "description": tool_def.get('description', ''),
-                    "metadata": tool_def.get('metadata', {})
-                })
+                mtime_ns = json_file.stat().st_mtime_ns
+                cached = self._list_cache.get(json_file)
+                if cached is None or cached[0] != mtime_ns:
+                    tool_def = _read_json(json_file)
+                    cached = (mtime_ns, {
+                        "name": tool_def.get('name', json_file.stem),
+                        "type": "json",
+                        "path": str(json_file),
+                        "description": tool_def.get('description', ''),
+                        "metadata": tool_def.get('metadata', {})
+                    })
+                    self._list_cache[json_file] = cached
+                tools.append(dict(cached[1]))
             except Exception as e:
                 logger.error(f"Failed to load {json_file}: {e}")
         
-        # List Python tools
-        for py_file in self.modules_dir.glob("*.py"):
-            if py_file.name.startswith('_'):
-                continue
-            tools.append({
-                "name": py_file.stem,
-                "type": "python",
-                "path": str(py_file),
-                "description": f"Python module: {py_file.stem}"
-            })
+        # List Python tools, reading only the TOOL_DEFINITION header of changed files
+        py_files = [p for p in self.modules_dir.glob("*.py") if not p.name.startswith('_')]
+        for stale in {p for p in self._list_cache if p.parent == self.modules_dir} - set(py_files):
+            del self._list_cache[stale]
+        
+        for py_file in py_files:
+            try:
+                mtime_ns = py_file.stat().st_mtime_ns
+                cached = self._list_cache.get(py_file)
+                if cached is None or cached[0] != mtime_ns:
+                    tool_def = _extract_tool_def_metadata(py_file)
+                    cached = (mtime_ns, {
+                        "name": tool_def.get('name', py_file.stem),
+                        "type": "python",
+                        "path": str(py_file),
+                        "description": tool_def.get('description') or f"Python module: {py_file.stem}"
+                    })
+                    self._list_cache[py_file] = cached
+                tools.append(dict(cached[1]))
+            except Exception as e:
+                logger.error(f"Failed to load {py_file}: {e}")
         
         return tools
     
@@ -310,16 +450,12 @@ class ToolManager:
         """Remove a tool"""
         removed = False
         
-        # Check JSON tools
-        json_path = self.tools_dir / f"{name}.json"
-        if json_path.exists():
-            json_path.unlink()
-            removed = True
-        
-        # Check Python tools
-        py_path = self.modules_dir / f"{name}.py"
-        if py_path.exists():
-            py_path.unlink()
+        # Check JSON and Python tools; unlink alone both tests and removes
+        for path in (self.tools_dir / f"{name}.json", self.modules_dir / f"{name}.py"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
             removed = True
         
         return removed
@@ -329,8 +465,7 @@ class ToolManager:
         # Try JSON tool first
         json_path = self.tools_dir / f"{name}.json"
         if json_path.exists():
-            with open(json_path, 'r') as f:
-                tool_def = json.load(f)
+            tool_def = _read_json(json_path)
             
             # Update fields
             for key, value in updates.items():
@@ -342,8 +477,7 @@ class ToolManager:
                 tool_def['metadata'] = {}
             tool_def['metadata']['updated'] = datetime.now().isoformat()
             
-            with open(json_path, 'w') as f:
-                json.dump(tool_def, f, indent=2)
+            _write_json(json_path, tool_def)
             
             return True
         
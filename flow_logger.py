@@ -4,11 +4,75 @@ Minimal Strategic Flow Logger
 Tracks only the essential 4-step dynamic agent flow progression
 """
 
+import atexit
 import json
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
+LOG_FILE = Path("flow_progress.log")
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+FLUSH_INTERVAL = 0.1  # seconds to coalesce log_step calls into one write
+FLUSH_BATCH = 64  # write immediately once this many entries are queued
+
+# Only these fields are kept in log entries to avoid noise
+_ESSENTIAL_KEYS = frozenset([
+    'agent_name', 'subagent_type', 'completion_signal', 'mcp_status',
+    'restart_status', 'task_preview', 'error'
+])
+
+# Handle shared by all flushes in this process
+_log_fh = None
+
+# Formatted entries waiting to be written, guarded by _buffer_lock
+_buffer = deque()
+_buffer_lock = threading.Lock()
+_flush_timer = None
+
+
+def _get_log_handle():
+    """Open the flow log once and reuse the handle"""
+    global _log_fh
+    if _log_fh is None or _log_fh.closed:
+        _log_fh = open(LOG_FILE, 'a', encoding='utf-8')
+    return _log_fh
+
+
+def _close_log_handle():
+    """Close the shared handle so the next write reopens the log file"""
+    global _log_fh
+    if _log_fh is not None:
+        _log_fh.close()
+        _log_fh = None
+
+
+def flush():
+    """Write all queued entries to the flow log with a single write"""
+    global _flush_timer
+    with _buffer_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _buffer:
+            return
+        lines = list(_buffer)
+        _buffer.clear()
+        
+        try:
+            fh = _get_log_handle()
+            fh.write("".join(lines))
+            fh.flush()
+        except Exception as e:
+            _close_log_handle()
+            # Fallback to stderr if file logging fails
+            for line in lines:
+                print(f"[FLOW-LOG-ERROR] {line.rstrip()} (file error: {e})", file=sys.stderr)
+
+
+atexit.register(flush)
+
 
 def log_step(step_num, event, data=None):
     """Log essential flow progression events only
@@ -18,28 +82,27 @@ def log_step(step_num, event, data=None):
         event (str): Brief description of what happened
         data (dict, optional): Essential data only (agent names, status, etc.)
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime(_TIMESTAMP_FORMAT)
     
     # Format log entry
     log_entry = f"{timestamp} [STEP-{step_num}] {event}"
     if data:
         # Only include essential fields to avoid noise
-        essential_data = {k: v for k, v in data.items() if k in [
-            'agent_name', 'subagent_type', 'completion_signal', 'mcp_status', 
-            'restart_status', 'task_preview', 'error'
-        ]}
+        essential_data = {k: v for k, v in data.items() if k in _ESSENTIAL_KEYS}
         if essential_data:
             log_entry += f": {json.dumps(essential_data, separators=(',', ':'))}"
     
-    # Write to single flow log file
-    log_file = Path("flow_progress.log")
-    try:
-        with open(log_file, 'a') as f:
-            f.write(log_entry + "\n")
-    except Exception as e:
-        # Fallback to stderr if file logging fails
-        print(f"[FLOW-LOG-ERROR] {log_entry} (file error: {e})", file=sys.stderr)
-        return
+    # Queue for the single flow log file; entries are written in batches
+    global _flush_timer
+    with _buffer_lock:
+        _buffer.append(log_entry + "\n")
+        full = len(_buffer) >= FLUSH_BATCH
+        if not full and _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+    if full:
+        flush()
     
     # Also output to stderr for immediate visibility
     print(f"🔄 {log_entry}", file=sys.stderr)
@@ -75,9 +138,11 @@ def log_error(step_num, error, data=None):
 
 def clear_flow_log():
     """Clear the flow log file (for fresh test runs)"""
-    log_file = Path("flow_progress.log")
+    with _buffer_lock:
+        _buffer.clear()
+        _close_log_handle()
     try:
-        log_file.unlink(missing_ok=True)
+        LOG_FILE.unlink(missing_ok=True)
         print("🗑️  Flow log cleared", file=sys.stderr)
     except Exception as e:
         print(f"❌ Could not clear flow log: {e}", file=sys.stderr)
@@ -85,15 +150,21 @@ def clear_flow_log():
 
 def show_flow_log():
     """Display the current flow log contents"""
-    log_file = Path("flow_progress.log")
-    if not log_file.exists():
+    flush()
+    try:
+        # Opening directly doubles as the existence check
+        f = open(LOG_FILE, 'r', encoding='utf-8')
+    except FileNotFoundError:
         print("📝 Flow log is empty", file=sys.stderr)
         return
+    except OSError as e:
+        print(f"❌ Could not read flow log: {e}", file=sys.stderr)
+        return
     
     print("📋 Current Flow Log:", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
     try:
-        with open(log_file, 'r') as f:
+        with f:
             for line in f:
                 print(line.rstrip(), file=sys.stderr)
     except Exception as e:
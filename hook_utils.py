@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Claude Code hooks in .claude/hooks
+Hooks run under python3 -S -I, so this module must stay stdlib-only
+"""
+
+import os
+
+
+def count_files(directory, suffix, limit):
+    """Count visible files ending in suffix with one scandir pass, stopping at limit"""
+    count = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and not entry.name.startswith('.'):
+                    count += 1
+                    if count >= limit:
+                        break
+    except FileNotFoundError:
+        pass
+    return count
@@ -1,19 +1,152 @@
 #!/usr/bin/env python3
 """
-Session Event Logger - Simple JSON Event Stream
-Captures ALL Claude Code session inputs/outputs in a single JSON file
+Session Event Logger - Simple JSON Lines Event Stream
+Captures ALL Claude Code session inputs/outputs in a single JSON Lines file
 """
 
+import atexit
 import json
+import os
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
 import fcntl
 
+LOG_FILE = Path("session_events.jsonl")
+FLUSH_INTERVAL = 0.05  # seconds to coalesce bursts of events into one write
+MAX_LOG_BYTES = 16 * 1024 * 1024  # rotate the log once it grows past this size
+JQ_MIN_BYTES = 1024 * 1024  # summarize logs at least this large with jq when installed
+# Single O_APPEND writes up to this size land whole on local filesystems, so
+# batches this small skip the flock
+ATOMIC_APPEND_BYTES = 4096
+# Most buffers a single writev() accepts
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+
+# jq program printing the same summary as _print_event, one event per input line
+_JQ_SUMMARY = r"""
+foreach (inputs | fromjson?) as $e (0; . + 1;
+  (tostring | if length < 2 then " " + . else . end) as $n
+  | (if $e.ts_ns then ($e.ts_ns / 1e9 | strflocaltime("%Y-%m-%dT%H:%M:%S"))
+     else ($e.timestamp // "?") end) as $t
+  | "\($n). [\($t)] \($e.event_type)",
+    (if $e.event_type == "user_prompt_submit" and ($e.data | has("prompt")) then
+       "    User: \($e.data.prompt | tostring | .[:100])..."
+     elif $e.event_type == "pre_tool_use" or $e.event_type == "post_tool_use" then
+       "    Tool: \($e.data.tool_name // "unknown")"
+     else empty end))
+"""
+
+# Serialized events waiting to be flushed, guarded by _buffer_lock
+_buffer = deque()
+_buffer_lock = threading.Lock()
+_flush_timer = None
+# Append-mode fd reused across flushes, dropped once the path names another file
+_log_fd = None
+
+
+def flush():
+    """Write all buffered events with a single locked append"""
+    global _flush_timer
+    with _buffer_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _buffer:
+            return
+        lines = list(_buffer)
+        _buffer.clear()
+        
+        try:
+            _rotate_if_needed()
+            _append(lines)
+        except Exception as e:
+            # Fallback: write to stderr if file logging fails
+            print(f"[SESSION-LOG-ERROR] {len(lines)} event(s): {e}", file=sys.stderr)
+            for line in lines:
+                print(f"[SESSION-LOG-FALLBACK] {line.decode()}", end="", file=sys.stderr)
+
+
+atexit.register(flush)
+
+
+def _append(lines):
+    """Append encoded lines to the log without interleaving with other hook processes"""
+    pending = deque(memoryview(line) for line in lines)
+    total = sum(len(line) for line in pending)
+    fd = _get_log_fd()
+    if total <= ATOMIC_APPEND_BYTES and len(pending) <= _IOV_MAX:
+        # The kernel gathers the lines directly; no joined copy is built
+        if _consume(pending, os.writev(fd, pending)) == 0:
+            return
+    
+    # Large batch (or a short write): serialize with other writers
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        while pending:
+            _consume(pending, os.writev(fd, list(islice(pending, _IOV_MAX))))
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _get_log_fd():
+    """Open the log for appending once and reuse the fd"""
+    global _log_fd
+    if _log_fd is None:
+        _log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    return _log_fd
+
+
+def _close_log_fd():
+    """Close the cached fd so the next append reopens the log path"""
+    global _log_fd
+    if _log_fd is not None:
+        os.close(_log_fd)
+        _log_fd = None
+
+
+def _consume(pending, written):
+    """Drop written bytes from the front of pending; returns the bytes still queued"""
+    while pending and written >= len(pending[0]):
+        written -= len(pending.popleft())
+    if written:
+        pending[0] = pending[0][written:]
+    return sum(len(line) for line in pending)
+
+
+def _rotate_if_needed():
+    """Move an oversized log aside as session_events.<ts>.jsonl so appends start fresh"""
+    try:
+        st = LOG_FILE.stat()
+    except FileNotFoundError:
+        # No log yet, or another process cleared or rotated it
+        _close_log_fd()
+        return
+    if _log_fd is not None:
+        cached = os.fstat(_log_fd)
+        if (cached.st_dev, cached.st_ino) != (st.st_dev, st.st_ino):
+            _close_log_fd()
+    if st.st_size <= MAX_LOG_BYTES:
+        return
+    try:
+        LOG_FILE.rename(LOG_FILE.with_name(f"{LOG_FILE.stem}.{time.time_ns()}{LOG_FILE.suffix}"))
+    except FileNotFoundError:
+        # Another process rotated it first
+        pass
+    _close_log_fd()
+
+
+def _encode_line(obj):
+    """Compact JSON line as bytes"""
+    return json.dumps(obj, separators=(',', ':')).encode() + b"\n"
+
 
 def log_session_event(event_type, data):
     """
-    Log a session event to session_events.json
+    Queue a session event for session_events.jsonl; buffered events are
+    flushed together after FLUSH_INTERVAL or at interpreter exit
     
     Args:
         event_type (str): Type of event (user_prompt_submit, pre_tool_use, post_tool_use, session_stop)
@@ -22,40 +155,21 @@ def log_session_event(event_type, data):
     
     # Create event entry
     event = {
-        "timestamp": datetime.now().isoformat(),
+        "ts_ns": time.time_ns(),  # formatted only when the log is displayed
         "event_type": event_type,
         "data": data
     }
     
-    # Path to session events log
-    log_file = Path("session_events.json")
+    # Serialize now so later changes to data don't leak into the log
+    line = _encode_line(event)
     
-    try:
-        # Read existing events or create empty list
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                try:
-                    events = json.load(f)
-                    if not isinstance(events, list):
-                        events = []
-                except json.JSONDecodeError:
-                    events = []
-        else:
-            events = []
-        
-        # Add new event
-        events.append(event)
-        
-        # Write back to file with file locking to prevent race conditions
-        with open(log_file, 'w') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            json.dump(events, f, indent=2)
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            
-    except Exception as e:
-        # Fallback: write to stderr if file logging fails
-        print(f"[SESSION-LOG-ERROR] {event_type}: {e}", file=sys.stderr)
-        print(f"[SESSION-LOG-FALLBACK] {json.dumps(event)}", file=sys.stderr)
+    global _flush_timer
+    with _buffer_lock:
+        _buffer.append(line)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
 
 
 def log_user_input(user_data):
@@ -80,10 +194,11 @@ def log_session_stop(stop_data):
 
 def clear_session_log():
     """Clear the session events log (for fresh sessions)"""
-    log_file = Path("session_events.json")
+    with _buffer_lock:
+        _buffer.clear()
+        _close_log_fd()
     try:
-        if log_file.exists():
-            log_file.unlink()
+        LOG_FILE.unlink(missing_ok=True)
         print("🗑️  Session events log cleared", file=sys.stderr)
     except Exception as e:
         print(f"❌ Could not clear session log: {e}", file=sys.stderr)
@@ -91,30 +206,73 @@ def clear_session_log():
 
 def show_session_log():
     """Display the current session events log"""
-    log_file = Path("session_events.json")
-    if not log_file.exists():
+    flush()
+    try:
+        # One stat both checks for the log and sizes it for the jq decision
+        size = LOG_FILE.stat().st_size
+    except FileNotFoundError:
         print("📝 Session events log is empty", file=sys.stderr)
         return
     
     try:
-        with open(log_file, 'r') as f:
-            events = json.load(f)
-        
         print("📋 Session Events Log:", file=sys.stderr)
         print("=" * 60, file=sys.stderr)
-        for i, event in enumerate(events, 1):
-            print(f"{i:2d}. [{event['timestamp']}] {event['event_type']}", file=sys.stderr)
-            if event['event_type'] == 'user_prompt_submit' and 'prompt' in event['data']:
-                print(f"    User: {event['data']['prompt'][:100]}...", file=sys.stderr)
-            elif event['event_type'] in ['pre_tool_use', 'post_tool_use']:
-                tool_name = event['data'].get('tool_name', 'unknown')
-                print(f"    Tool: {tool_name}", file=sys.stderr)
+        if not _show_with_jq(size):
+            for i, event in enumerate(iter_session_events(), 1):
+                _print_event(i, event)
         print("=" * 60, file=sys.stderr)
         
     except Exception as e:
         print(f"❌ Could not read session log: {e}", file=sys.stderr)
 
 
+def _show_with_jq(size):
+    """Print the summary of a large log with jq; returns False to use the Python path"""
+    import shutil
+    import subprocess
+    
+    if size < JQ_MIN_BYTES:
+        return False
+    jq = shutil.which("jq")
+    if jq is None:
+        return False
+    
+    sys.stderr.flush()
+    try:
+        result = subprocess.run([jq, "-nrR", _JQ_SUMMARY, str(LOG_FILE)], stdout=sys.stderr)
+    except (OSError, ValueError):
+        return False
+    return result.returncode == 0
+
+
+def iter_session_events():
+    """Yield logged events one at a time, skipping torn or malformed lines"""
+    with open(LOG_FILE, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _print_event(i, event):
+    """Print a one-line summary of a logged event"""
+    from datetime import datetime  # only needed when displaying the log
+    
+    if 'ts_ns' in event:
+        timestamp = datetime.fromtimestamp(event['ts_ns'] / 1e9).isoformat(timespec='seconds')
+    else:
+        timestamp = event.get('timestamp', '?')
+    print(f"{i:2d}. [{timestamp}] {event['event_type']}", file=sys.stderr)
+    if event['event_type'] == 'user_prompt_submit' and 'prompt' in event['data']:
+        print(f"    User: {event['data']['prompt'][:100]}...", file=sys.stderr)
+    elif event['event_type'] in ['pre_tool_use', 'post_tool_use']:
+        tool_name = event['data'].get('tool_name', 'unknown')
+        print(f"    Tool: {tool_name}", file=sys.stderr)
+
+
 if __name__ == '__main__':
     # CLI interface for testing
     import argparse
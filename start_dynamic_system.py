@@ -4,11 +4,138 @@ Dynamic Agent System Launcher
 Starts Claude Code with primary agent configuration
 """
 
+import hashlib
 import os
 import sys
+import selectors
+import shutil
 import signal
 import subprocess
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+
+# Optional: inotify/FSEvents-backed notification when the restart marker appears
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# Resolve the CLI once so each (re)launch skips the PATH search
+CLAUDE_BIN = shutil.which("claude") or "claude"
+# CRITICAL: Restrict primary agent to Task only
+ALLOWED_TOOLS_ARGS = ("--allowedTools", "Task")
+# How often to check for the restart marker when watchdog is unavailable
+MARKER_POLL_INTERVAL = 1.0
+# Safety re-check interval while watchdog is delivering marker events
+MARKER_RECHECK_INTERVAL = 10.0
+
+# Appended to the primary agent prompt to restate the Task-only rule
+ENHANCED_PROMPT_SUFFIX = """
+
+🚨 CRITICAL: You can ONLY use the Task tool. All other tools are FORBIDDEN.
+
+If you attempt any non-Task tool, respond: "TOOL_VIOLATION: [toolname] - Task delegation required" and delegate to meta-agent via Task tool.
+"""
+
+USAGE = """usage: start_dynamic_system.py [-h] [--interactive]
+                               [--test-prompt TEST_PROMPT] [--headless]
+                               [--exit-after-completion]
+                               [task]"""
+
+HELP = USAGE + """
+
+🔄 Dynamic Agent System
+
+positional arguments:
+  task                  Task to execute
+
+options:
+  -h, --help            show this help message and exit
+  --interactive         Interactive mode
+  --test-prompt TEST_PROMPT
+                        Test prompt for validation
+  --headless            Run without UI, output result only
+  --exit-after-completion
+                        Exit automatically after task completion"""
+
+# Boolean launcher flags and the attribute each one sets
+_FLAG_ARGS = {
+    "--interactive": "interactive",
+    "--headless": "headless",
+    "--exit-after-completion": "exit_after_completion",
+}
+
+
+class _MarkerHandler(FileSystemEventHandler):
+    """Wakes the supervisor loop when the restart marker is created"""
+    
+    def __init__(self, marker_name, wake_fd):
+        self.marker_name = marker_name
+        self.wake_fd = wake_fd
+    
+    def on_any_event(self, event):
+        paths = (getattr(event, 'src_path', ''), getattr(event, 'dest_path', ''))
+        if any(p and Path(os.fsdecode(p)).name == self.marker_name for p in paths):
+            _wake(self.wake_fd)
+
+
+def _wake(fd):
+    """Nudge the supervisor's selector; a full pipe already means a wakeup is pending"""
+    try:
+        os.write(fd, b"\0")
+    except (BlockingIOError, OSError):
+        pass
+
+def _terminate_group(proc, pgid, timeout=5):
+    """SIGTERM the child's process group, escalating to SIGKILL after timeout"""
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+        proc.wait(timeout=timeout)
+    except ProcessLookupError:
+        # Whole group already exited
+        proc.wait()
+    except subprocess.TimeoutExpired:
+        os.killpg(pgid, signal.SIGKILL)
+        proc.wait()
+
+def _claim_marker(path):
+    """Remove the marker if present; one unlink both tests for it and consumes it"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def _cached_prompt_file(prompt):
+    """Write the prompt once to a content-addressed file, on tmpfs when available"""
+    data = prompt.encode()
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else Path(tempfile.gettempdir())
+    path = base / f"se_agent_prompt_{digest}.md"
+    if not path.exists():
+        # Write then rename so a concurrent launcher never sees a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=base, suffix=".md.tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    return path
+
+def _prompt_memfd(prompt):
+    """Hold the prompt in an anonymous in-memory file; returns its fd or None"""
+    if not hasattr(os, "memfd_create") or not os.path.isdir("/proc/self/fd"):
+        return None
+    try:
+        fd = os.memfd_create("se_agent_prompt")
+    except OSError:
+        return None
+    data = memoryview(prompt.encode())
+    while data:
+        data = data[os.write(fd, data):]
+    return fd
 
 def setup_configuration(headless=False):
     """Set up the configuration for dynamic agent system"""
@@ -30,36 +157,27 @@ def start_claude_with_config(system_prompt, task=None, headless=False, exit_afte
     """Start Claude Code with primary agent configuration"""
     
     # CRITICAL: Create concise system prompt to avoid command line length issues
-    enhanced_prompt = system_prompt + """
-
-🚨 CRITICAL: You can ONLY use the Task tool. All other tools are FORBIDDEN.
-
-If you attempt any non-Task tool, respond: "TOOL_VIOLATION: [toolname] - Task delegation required" and delegate to meta-agent via Task tool.
-"""
+    enhanced_prompt = system_prompt + ENHANCED_PROMPT_SUFFIX
     
-    # Create temporary system prompt file to avoid command line length issues
-    import tempfile
-    prompt_file = tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False)
-    prompt_file.write(enhanced_prompt)
-    prompt_file.flush()
-    prompt_file.close()
+    # Pass the prompt as a file to avoid command line length issues. On Linux the
+    # file is a memfd handed to the child and opened via /proc/self/fd, so nothing
+    # touches the filesystem; elsewhere fall back to a content-keyed cached file
+    prompt_fd = _prompt_memfd(enhanced_prompt)
+    if prompt_fd is not None:
+        prompt_file = f"/proc/self/fd/{prompt_fd}"
+        prompt_fds = (prompt_fd,)
+    else:
+        prompt_file = _cached_prompt_file(enhanced_prompt)
+        prompt_fds = ()
     
     # Build Claude command - ENFORCED tool restriction for primary agent
     # PRIMARY AGENT: Only Task tool allowed (enforced by Claude Code flags)
     # SUBAGENTS: Full tool access (flags don't affect subagents)
-    cmd = [
-        "claude",
-        "--system-prompt-file", prompt_file.name,
-        "--allowedTools", "Task"  # CRITICAL: Restrict primary agent to Task only
-    ]
-    
-    # Add permission mode based on headless setting
-    if headless:
-        # Headless mode: bypass permissions for non-interactive execution
-        cmd.extend(["--permission-mode", "bypassPermissions"])
-    else:
-        # Interactive mode: accept edits to create subagents
-        cmd.extend(["--permission-mode", "acceptEdits"])
+    # Permission mode based on headless setting:
+    # headless bypasses permissions for non-interactive execution,
+    # interactive accepts edits to create subagents
+    permission_args = ["--permission-mode", "bypassPermissions" if headless else "acceptEdits"]
+    cmd = [CLAUDE_BIN, "--system-prompt-file", str(prompt_file), *ALLOWED_TOOLS_ARGS, *permission_args]
     
     # DUAL ENFORCEMENT: System prompt + Claude Code flags
     # Primary agent: Restricted to Task tool only (via --allowedTools)
@@ -88,58 +206,95 @@ If you attempt any non-Task tool, respond: "TOOL_VIOLATION: [toolname] - Task de
         print(f"🔧 Command: claude --system-prompt-file [TEMP_FILE] --permission-mode acceptEdits")
     
     # Execute Claude Code with restart monitoring
-    import time
     RESTART_MARKER = Path(".restart_needed")
     child_proc = None
+    
+    # The supervisor sleeps on a self-pipe: SIGCHLD (child exit) writes to it via
+    # the signal wakeup fd, and the watchdog observer writes when the marker appears
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    selector = selectors.DefaultSelector()
+    selector.register(wake_r, selectors.EVENT_READ)
+    old_wakeup_fd = signal.set_wakeup_fd(wake_w)
+    old_sigchld = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    # SIGTERM/SIGHUP (e.g. from systemd or a CI runner) only record the signal; the
+    # wakeup fd rouses the loop, which then tears the child group down exactly once
+    stop_signals = []
+    old_stop_handlers = {
+        sig: signal.signal(sig, lambda signum, frame: stop_signals.append(signum))
+        for sig in (signal.SIGTERM, signal.SIGHUP)
+    }
+    
+    observer = None
+    if Observer is not None:
+        try:
+            observer = Observer()
+            observer.schedule(_MarkerHandler(RESTART_MARKER.name, wake_w), os.getcwd(), recursive=False)
+            observer.start()
+        except Exception:
+            observer = None
+    wait_timeout = MARKER_RECHECK_INTERVAL if observer is not None else MARKER_POLL_INTERVAL
+    
     try:
         # Helper to launch Claude
-        def launch(cmd_args):
+        def launch(cmd_args, stdin_text=None, pass_fds=()):
             if not headless:
                 print(f"▶️ Launching: {' '.join(cmd_args)}")
-            # Launch Claude in its own process group so we can terminate the whole tree
-            return subprocess.Popen(cmd_args, cwd=os.getcwd(), start_new_session=True)
+            # Launch Claude in its own process group so we can terminate the whole tree.
+            # Without preexec_fn, user/group/extra_groups or umask, CPython 3.10+
+            # spawns the child via vfork() rather than a full fork()
+            proc = subprocess.Popen(
+                cmd_args,
+                stdin=subprocess.PIPE if stdin_text is not None else None,
+                pass_fds=pass_fds,
+                start_new_session=True
+            )
+            if stdin_text is not None:
+                try:
+                    proc.stdin.write(stdin_text.encode())
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    # Child exited before reading; the main loop reports its exit code
+                    pass
+            return proc
 
+        # A marker left behind by an earlier run must not restart this session
+        _claim_marker(RESTART_MARKER)
         if task:
-            # First launch includes the user task
-            task_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-            task_file.write(task)
-            task_file.flush()
-            task_file.close()
-            child_proc = launch(cmd + ["-p", f"@{task_file.name}"])
+            # First launch includes the user task, piped to `claude -p` on stdin
+            child_proc = launch(cmd + ["-p"], stdin_text=task, pass_fds=prompt_fds)
         else:
-            child_proc = launch(cmd)
+            child_proc = launch(cmd, pass_fds=prompt_fds)
+        # start_new_session makes the child its own process-group leader
+        pgid = child_proc.pid
 
         # Main loop: watch for marker file or process exit
         while True:
+            if stop_signals:
+                if not headless:
+                    print(f"🛑 Received {signal.Signals(stop_signals[0]).name} — stopping Claude")
+                _terminate_group(child_proc, pgid)
+                Path(".primary_locked").unlink(missing_ok=True)
+                return 128 + stop_signals[0]
             ret_code = child_proc.poll()
-            if RESTART_MARKER.exists():
+            if _claim_marker(RESTART_MARKER):
                 if not headless:
                     print("🔄 Restart marker detected — restarting Claude")
-                RESTART_MARKER.unlink(missing_ok=True)
                 # Graceful termination
                 # Terminate entire process group (Claude may spawn children)
-                pgid = os.getpgid(child_proc.pid)
-                os.killpg(pgid, signal.SIGTERM)
-                try:
-                    child_proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    os.killpg(pgid, signal.SIGKILL)
+                _terminate_group(child_proc, pgid)
                 # Mark that restart occurred so hooks in next session can enforce stricter rules
                 Path(".primary_locked").touch()
                 # Relaunch with --continue to preserve session context and continue task
                 # This allows the Phoenix restart to maintain conversation history and context
                 restart_cmd = [
-                    "claude", 
+                    CLAUDE_BIN,
                     "--continue", "meta-agent finished. continue with original task",
-                    "--allowedTools", "Task"
+                    *ALLOWED_TOOLS_ARGS, *permission_args
                 ]
-                
-                # Add permission mode based on headless setting
-                if headless:
-                    restart_cmd.extend(["--permission-mode", "bypassPermissions"])
-                else:
-                    restart_cmd.extend(["--permission-mode", "acceptEdits"])
                 child_proc = launch(restart_cmd)
+                pgid = child_proc.pid
                 
                 # Track that we've restarted - next exit might be task completion
                 restarted_once = True
@@ -158,34 +313,73 @@ If you attempt any non-Task tool, respond: "TOOL_VIOLATION: [toolname] - Task de
                         print("✅ Task completed, exiting as requested")
                         
                 return ret_code
-            time.sleep(1)
+            
+            # Sleep until the child exits, the marker appears, or the timeout elapses
+            selector.select(wait_timeout)
+            try:
+                while os.read(wake_r, 4096):
+                    pass
+            except BlockingIOError:
+                pass
     except KeyboardInterrupt:
         print("\n👋 Dynamic agent system stopped by user")
         if child_proc and child_proc.poll() is None:
-            os.killpg(os.getpgid(child_proc.pid), signal.SIGTERM)
+            _terminate_group(child_proc, pgid)
         return 0
     except Exception as e:
         print(f"❌ Error starting system: {e}")
         return 1
     finally:
-        # Clean up temporary file
-        try:
-            os.unlink(prompt_file.name)
-        except:
-            pass
+        signal.set_wakeup_fd(old_wakeup_fd)
+        signal.signal(signal.SIGCHLD, old_sigchld)
+        for sig, handler in old_stop_handlers.items():
+            signal.signal(sig, handler)
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        selector.close()
+        os.close(wake_r)
+        os.close(wake_w)
+        if prompt_fd is not None:
+            os.close(prompt_fd)
+
+def _usage_error(message):
+    """Report a command line error the way argparse does and exit with status 2"""
+    print(USAGE, file=sys.stderr)
+    print(f"start_dynamic_system.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+def parse_args(argv):
+    """Parse launcher arguments; hand-rolled so startup skips the argparse import"""
+    args = SimpleNamespace(task=None, test_prompt=None, **{name: False for name in _FLAG_ARGS.values()})
+    positional_only = False
+    remaining = iter(argv)
+    for arg in remaining:
+        if positional_only or arg == "-" or not arg.startswith("-"):
+            if args.task is not None:
+                _usage_error(f"unrecognized arguments: {arg}")
+            args.task = arg
+        elif arg == "--":
+            positional_only = True
+        elif arg in ("-h", "--help"):
+            print(HELP)
+            sys.exit(0)
+        elif arg in _FLAG_ARGS:
+            setattr(args, _FLAG_ARGS[arg], True)
+        elif arg == "--test-prompt" or arg.startswith("--test-prompt="):
+            name, eq, value = arg.partition("=")
+            if not eq:
+                value = next(remaining, None)
+                if value is None or value.startswith("-"):
+                    _usage_error("argument --test-prompt: expected one argument")
+            args.test_prompt = value
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+    return args
 
 def main():
     """Main launcher"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="🔄 Dynamic Agent System")
-    parser.add_argument("task", nargs="?", help="Task to execute")
-    parser.add_argument("--interactive", action="store_true", help="Interactive mode")
-    parser.add_argument("--test-prompt", help="Test prompt for validation")
-    parser.add_argument("--headless", action="store_true", help="Run without UI, output result only")
-    parser.add_argument("--exit-after-completion", action="store_true", help="Exit automatically after task completion")
-    
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
     
     if not args.headless:
         print("🔄 DYNAMIC AGENT SYSTEM LAUNCHER")
@@ -217,7 +411,7 @@ def main():
         return_code = start_claude_with_config(system_prompt, None, args.headless, args.exit_after_completion)  
     else:
         # Default: show help
-        parser.print_help()
+        print(HELP)
         return_code = 0
     
     sys.exit(return_code)